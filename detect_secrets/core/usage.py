@@ -650,11 +650,11 @@ class PluginOptions:
 
     @staticmethod
     def get_disabled_plugins(args):
-        return [
+        return frozenset(
             plugin.classname
             for plugin in PluginOptions.all_plugins
             if plugin.classname not in args.plugins
-        ]
+        )
 
     @staticmethod
     def consolidate_args(args):
@@ -3,10 +3,17 @@ import sys
 
 from .util import get_mapping_from_secret_type_to_class_name
 from .util import import_plugins
+from .util import normalize_plugin_filenames
 from detect_secrets.core.log import log
 from detect_secrets.core.usage import PluginOptions
 
 
+# Warnings are only colored when stderr is a terminal, as determined at import time.
+_STDERR_IS_TTY = sys.stderr is not None and sys.stderr.isatty()
+_ANSI_YELLOW = '\033[93m' if _STDERR_IS_TTY else ''
+_ANSI_RESET = '\033[0m' if _STDERR_IS_TTY else ''
+
+
 def from_parser_builder(
     plugins_dict,
     exclude_lines_regex=None,
@@ -31,21 +38,24 @@ def from_parser_builder(
 
     :returns: tuple of initialized plugins
     """
-    output = []
-
-    for plugin_name in plugins_dict:
-        output.append(
-            from_plugin_classname(
-                plugin_name,
-                exclude_lines_regex=exclude_lines_regex,
-                automaton=automaton,
-                should_verify_secrets=should_verify_secrets,
-                plugin_filenames=plugin_filenames,
-                **plugins_dict[plugin_name]
-            ),
-        )
+    if not plugins_dict:
+        return ()
+
+    plugin_filenames = normalize_plugin_filenames(plugin_filenames)
+    shared_kwargs = {
+        'exclude_lines_regex': exclude_lines_regex,
+        'automaton': automaton,
+        'should_verify_secrets': should_verify_secrets,
+        'plugin_filenames': plugin_filenames,
+
+        # Resolve the plugin registry once, rather than once per plugin.
+        '_klass_map': import_plugins(plugin_filenames),
+    }
 
-    return tuple(output)
+    return tuple(
+        from_plugin_classname(plugin_name, **shared_kwargs, **plugin_params)
+        for plugin_name, plugin_params in plugins_dict.items()
+    )
 
 
 def _get_prioritized_parameters(plugins_dict, is_using_default_value_map, prefer_default=True):
@@ -60,10 +70,22 @@ def _get_prioritized_parameters(plugins_dict, is_using_default_value_map, prefer
     :param prefer_default: if True, will yield if plugin parameters are from default values.
         Otherwise, will yield if plugin parameters are *not* from default values.
     """
+    # Parameters missing from `is_using_default_value_map` are treated as
+    # not using a default value.
+    default_param_names = frozenset(
+        param_name
+        for param_name, is_using_default in is_using_default_value_map.items()
+        if is_using_default
+    )
+
+    # Without any defaulted parameters, there's nothing to yield: skip
+    # walking through every plugin's params.
+    if prefer_default and not default_param_names:
+        return
+
     for plugin_name, plugin_params in plugins_dict.items():
         for param_name, param_value in plugin_params.items():
-            is_using_default = is_using_default_value_map.get(param_name, False)
-            if is_using_default == prefer_default:
+            if (param_name in default_param_names) == prefer_default:
                 yield plugin_name, param_name, param_value
 
 
@@ -82,73 +104,128 @@ def merge_plugins_from_baseline(baseline_plugins, args, automaton):
 
     :returns: tuple of initialized plugins
     """
-    def _remove_key(d, key):
-        r = dict(d)
-        r.pop(key)
-        return r
-
+    input_plugins = args.plugins
+    is_using_default_value = args.is_using_default_value
+    exclude_lines_regex = args.exclude_lines
+    should_verify_secrets = not args.no_verify
+    plugin_filenames = args.plugin_filenames
+
+    # `vars()` goes through `BasePlugin.__dict__`, which only exposes a plugin's
+    # name and init params (as written to "plugins_used"), not its internal state.
     baseline_plugins_dict = {
-        vars(plugin)['name']: _remove_key(vars(plugin), 'name')
-        for plugin in baseline_plugins
+        plugin_params['name']: {
+            param_name: param_value
+            for param_name, param_value in plugin_params.items()
+            if param_name != 'name'
+        }
+        for plugin_params in map(vars, baseline_plugins)
     }
 
-    # Use input plugin as starting point
     if args.use_all_plugins:
-        # Input param and default param are used
-        plugins_dict = dict(args.plugins)
-
-        # Baseline param priority > default
-        for plugin_name, param_name, param_value in _get_prioritized_parameters(
+        plugins_dict = _merge_baseline_into_input_plugins(
             baseline_plugins_dict,
-            args.is_using_default_value,
-            prefer_default=True,
-        ):
-            try:
-                plugins_dict[plugin_name][param_name] = param_value
-            except KeyError:  # pragma: no cover
-                log.warning(
-                    'Baseline contains plugin {} which is not in all plugins! Ignoring...'
-                    .format(plugin_name),
-                )
-
-        return from_parser_builder(
-            plugins_dict,
-            exclude_lines_regex=args.exclude_lines,
-            automaton=automaton,
-            should_verify_secrets=not args.no_verify,
-            plugin_filenames=args.plugin_filenames,
+            input_plugins,
+            is_using_default_value,
         )
+    else:
+        plugins_dict = _merge_input_into_baseline_plugins(
+            baseline_plugins_dict,
+            input_plugins,
+            is_using_default_value,
+            disabled_plugins=PluginOptions.get_disabled_plugins(args),
+        )
+
+    return from_parser_builder(
+        plugins_dict,
+        exclude_lines_regex=exclude_lines_regex,
+        automaton=automaton,
+        should_verify_secrets=should_verify_secrets,
+        plugin_filenames=plugin_filenames,
+    )
+
+
+def _merge_baseline_into_input_plugins(
+    baseline_plugins_dict,
+    input_plugins_dict,
+    is_using_default_value_map,
+):
+    """
+    Uses input plugins as the starting point: input and default params are used,
+    but baseline params take priority over default ones.
+
+    :type baseline_plugins_dict: dict(plugin_name => plugin_params)
+    :type input_plugins_dict: dict(plugin_name => plugin_params)
+    :type is_using_default_value_map: dict(str => bool)
 
-    # Use baseline plugin as starting point
-    disabled_plugins = PluginOptions.get_disabled_plugins(args)
+    :rtype: dict(plugin_name => plugin_params)
+    """
+    plugins_dict = dict(input_plugins_dict)
+
+    # The params of each plugin are shared with `args.plugins`, so copy
+    # them before the first override rather than mutating them in place.
+    overridden_plugins = set()
+
+    for plugin_name, param_name, param_value in _get_prioritized_parameters(
+        baseline_plugins_dict,
+        is_using_default_value_map,
+        prefer_default=True,
+    ):
+        if plugin_name not in plugins_dict:  # pragma: no cover
+            log.warning(
+                'Baseline contains plugin %s which is not in all plugins! Ignoring...',
+                plugin_name,
+            )
+            continue
+
+        if plugin_name not in overridden_plugins:
+            plugins_dict[plugin_name] = dict(plugins_dict[plugin_name])
+            overridden_plugins.add(plugin_name)
+
+        plugins_dict[plugin_name][param_name] = param_value
+
+    return plugins_dict
+
+
+def _merge_input_into_baseline_plugins(
+    baseline_plugins_dict,
+    input_plugins_dict,
+    is_using_default_value_map,
+    disabled_plugins,
+):
+    """
+    Uses baseline plugins (minus disabled ones) as the starting point, but
+    non-default input params take priority over baseline ones.
+
+    :type baseline_plugins_dict: dict(plugin_name => plugin_params)
+    :type input_plugins_dict: dict(plugin_name => plugin_params)
+    :type is_using_default_value_map: dict(str => bool)
+
+    :type disabled_plugins: frozenset
+    :param disabled_plugins: names of plugins disabled through command line options.
+
+    :rtype: dict(plugin_name => plugin_params)
+    """
     plugins_dict = {
         plugin_name: plugin_params
         for plugin_name, plugin_params in baseline_plugins_dict.items()
         if plugin_name not in disabled_plugins
     }
 
-    # Input param priority > baseline
-    input_plugins_dict = dict(args.plugins)
     for plugin_name, param_name, param_value in _get_prioritized_parameters(
         input_plugins_dict,
-        args.is_using_default_value,
+        is_using_default_value_map,
         prefer_default=False,
     ):
-        try:
+        if plugin_name in plugins_dict:
             plugins_dict[plugin_name][param_name] = param_value
-        except KeyError:
+        else:
             log.debug(
-                '{} specified, but {} not configured! Ignoring...'
-                .format(''.join(['--', param_name.replace('_', '-')]), plugin_name),
+                '--%s specified, but %s not configured! Ignoring...',
+                param_name.replace('_', '-'),
+                plugin_name,
             )
 
-    return from_parser_builder(
-        plugins_dict,
-        exclude_lines_regex=args.exclude_lines,
-        automaton=automaton,
-        should_verify_secrets=not args.no_verify,
-        plugin_filenames=args.plugin_filenames,
-    )
+    return plugins_dict
 
 
 def from_plugin_classname(
@@ -157,6 +234,7 @@ def from_plugin_classname(
     automaton=None,
     should_verify_secrets=False,
     plugin_filenames=None,
+    _klass_map=None,
     **kwargs,
 ):
     """Initializes a plugin class, given a classname and kwargs.
@@ -175,23 +253,26 @@ def from_plugin_classname(
     :type plugin_filenames: tuple
     :param plugin_filenames: the plugin filenames.
 
-    :type plugin_filenames: tuple
+    :type _klass_map: dict|None
+    :param _klass_map: optional, already resolved output of `import_plugins`.
+        Used by `from_parser_builder` to avoid looking up the registry per plugin.
     """
+    if _klass_map is None:
+        _klass_map = import_plugins(normalize_plugin_filenames(plugin_filenames))
+
     try:
-        klass = import_plugins(plugin_filenames)[plugin_classname]
+        klass = _klass_map[plugin_classname]
     except KeyError:
-        yellow = '\033[93m'
-        end_yellow = '\033[0m'
-        print(
-            yellow,
-            'Warning: No such %s plugin to initialize.\n' % plugin_classname,
-            'Chances are you\'ve disabled it with command line options,',
-            'or need to run `pre-commit autoupdate`.\n',
-            'This error occurs when using a baseline file that',
-            'references a plugin which is disabled or not installed.',
-            end_yellow,
-            file=sys.stderr,
-            flush=True,
+        sys.stderr.write(
+            '%sWarning: No such %s plugin to initialize.\n'
+            'Chances are you\'ve disabled it with command line options, '
+            'or need to run `pre-commit autoupdate`.\n'
+            'This error occurs when using a baseline file that '
+            'references a plugin which is disabled or not installed.%s\n' % (
+                _ANSI_YELLOW,
+                plugin_classname,
+                _ANSI_RESET,
+            ),
         )
         return None
 
@@ -228,6 +309,7 @@ def from_secret_type(secret_type, settings, plugin_filenames=None):
     :type plugin_filenames: tuple
     :param plugin_filenames: the plugin filenames.
     """
+    plugin_filenames = normalize_plugin_filenames(plugin_filenames)
     mapping = get_mapping_from_secret_type_to_class_name(plugin_filenames=plugin_filenames)
     try:
         classname = mapping[secret_type]
@@ -248,5 +330,6 @@ def from_secret_type(secret_type, settings, plugin_filenames=None):
                 automaton=None,
                 should_verify_secrets=False,
 
+                _klass_map=import_plugins(plugin_filenames),
                 **plugin_init_vars
             )
@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 from abc import abstractproperty
 from functools import lru_cache
 from importlib import import_module
@@ -8,7 +9,24 @@ from detect_secrets.plugins.base import BasePlugin
 from detect_secrets.util import get_root_directory
 
 
-@lru_cache(maxsize=1)
+def normalize_plugin_filenames(plugin_filenames):
+    """
+    Plugin lookups are cached by `plugin_filenames`, so callers should pass
+    it through here first: lists would be unhashable, and differently ordered
+    tuples would be cached separately.
+
+    :type plugin_filenames: Iterable[str]|None
+    :param plugin_filenames: the plugin filenames. None means all plugins.
+
+    :rtype: tuple|None
+    """
+    if plugin_filenames is None:
+        return None
+
+    return tuple(sorted(set(plugin_filenames)))
+
+
+@lru_cache(maxsize=None)
 def get_mapping_from_secret_type_to_class_name(plugin_filenames=None):
     """Returns secret_type => plugin classname"""
     return {
@@ -17,14 +35,32 @@ def get_mapping_from_secret_type_to_class_name(plugin_filenames=None):
     }
 
 
-@lru_cache(maxsize=1)
+# plugin_filenames => output of `_import_plugins`
+_plugins_cache = {}
+_plugins_cache_lock = threading.Lock()
+
+
 def import_plugins(plugin_filenames=None):
     """
+    Plugins are only imported once per `plugin_filenames`, even when
+    first requested from several threads at the same time.
+
     :type plugin_filenames: tuple
     :param plugin_filenames: the plugin filenames.
 
     :rtype: Dict[str, Type[TypeVar('Plugin', bound=BasePlugin)]]
     """
+    if plugin_filenames in _plugins_cache:
+        return _plugins_cache[plugin_filenames]
+
+    with _plugins_cache_lock:
+        if plugin_filenames not in _plugins_cache:
+            _plugins_cache[plugin_filenames] = _import_plugins(plugin_filenames)
+
+        return _plugins_cache[plugin_filenames]
+
+
+def _import_plugins(plugin_filenames):
     modules = []
     for root, _, files in os.walk(
         os.path.join(get_root_directory(), 'detect_secrets/plugins'),
@@ -1,6 +1,7 @@
 import pytest
 
 from detect_secrets.core.usage import ParserBuilder
+from detect_secrets.core.usage import PluginOptions
 from detect_secrets.plugins.common.util import import_plugins
 
 
@@ -46,6 +47,14 @@ class TestPluginOptions:
 
         assert 'PrivateKeyDetector' not in args.plugins
 
+    def test_get_disabled_plugins(self):
+        args = self.parse_args('--no-private-key-scan')
+
+        disabled_plugins = PluginOptions.get_disabled_plugins(args)
+
+        assert 'PrivateKeyDetector' in disabled_plugins
+        assert 'HexHighEntropyString' not in disabled_plugins
+
     def test_db2_plugin_disabled_by_default(self):
         args = self.parse_args('')
 
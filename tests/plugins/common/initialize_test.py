@@ -1,9 +1,142 @@
+from io import StringIO
+
 import mock
 import pytest
 
+from detect_secrets.core.usage import ParserBuilder
 from detect_secrets.plugins.common import initialize
 from detect_secrets.plugins.high_entropy_strings import Base64HighEntropyString
 from detect_secrets.plugins.high_entropy_strings import HexHighEntropyString
+from testing.util import uncolor
+
+
+class TestFromParserBuilder:
+
+    def test_success(self):
+        plugins = initialize.from_parser_builder(
+            {
+                'HexHighEntropyString': {
+                    'hex_limit': 4,
+                },
+                'Base64HighEntropyString': {
+                    'base64_limit': 3,
+                },
+            },
+        )
+
+        assert isinstance(plugins, tuple)
+        assert isinstance(plugins[0], HexHighEntropyString)
+        assert plugins[0].entropy_limit == 4
+        assert isinstance(plugins[1], Base64HighEntropyString)
+        assert plugins[1].entropy_limit == 3
+
+    def test_unhashable_plugin_filenames(self):
+        plugins = initialize.from_parser_builder(
+            {
+                'HexHighEntropyString': {
+                    'hex_limit': 4,
+                },
+            },
+            plugin_filenames=['high_entropy_strings', 'private_key'],
+        )
+
+        assert isinstance(plugins[0], HexHighEntropyString)
+
+    def test_no_plugins(self):
+        with mock.patch.object(
+            initialize,
+            'import_plugins',
+        ) as mock_import_plugins:
+            assert initialize.from_parser_builder({}) == ()
+
+        mock_import_plugins.assert_not_called()
+
+    def test_resolves_plugins_once(self):
+        with mock.patch.object(
+            initialize,
+            'import_plugins',
+            wraps=initialize.import_plugins,
+        ) as mock_import_plugins:
+            initialize.from_parser_builder(
+                {
+                    'HexHighEntropyString': {
+                        'hex_limit': 4,
+                    },
+                    'PrivateKeyDetector': {},
+                },
+            )
+
+        mock_import_plugins.assert_called_once_with(None)
+
+
+class TestMergePluginsFromBaseline:
+
+    @staticmethod
+    def parse_args(argument_string=''):
+        return ParserBuilder()\
+            .add_pre_commit_arguments()\
+            .parse_args(argument_string.split())
+
+    def test_baseline_params_override_defaults(self):
+        plugins = initialize.merge_plugins_from_baseline(
+            (HexHighEntropyString(hex_limit=2),),
+            self.parse_args(),
+            automaton=None,
+        )
+
+        assert len(plugins) == 1
+        assert isinstance(plugins[0], HexHighEntropyString)
+        assert plugins[0].entropy_limit == 2
+
+    def test_input_params_override_baseline(self):
+        plugins = initialize.merge_plugins_from_baseline(
+            (HexHighEntropyString(hex_limit=2),),
+            self.parse_args('--hex-limit 5'),
+            automaton=None,
+        )
+
+        assert plugins[0].entropy_limit == 5
+
+    def test_ignores_input_params_for_plugins_not_in_baseline(self):
+        plugins = initialize.merge_plugins_from_baseline(
+            (Base64HighEntropyString(base64_limit=2),),
+            self.parse_args('--hex-limit 5'),
+            automaton=None,
+        )
+
+        assert len(plugins) == 1
+        assert isinstance(plugins[0], Base64HighEntropyString)
+
+    def test_use_all_plugins_does_not_modify_args(self):
+        args = self.parse_args('--use-all-plugins')
+
+        plugins = initialize.merge_plugins_from_baseline(
+            (HexHighEntropyString(hex_limit=2),),
+            args,
+            automaton=None,
+        )
+
+        hex_plugin = next(
+            plugin
+            for plugin in plugins
+            if isinstance(plugin, HexHighEntropyString)
+        )
+        assert hex_plugin.entropy_limit == 2
+        assert args.plugins['HexHighEntropyString']['hex_limit'] == 3
+
+    def test_does_not_carry_over_plugin_state(self):
+        plugins = initialize.merge_plugins_from_baseline(
+            (
+                HexHighEntropyString(
+                    hex_limit=2,
+                    exclude_lines_regex='^ignored$',
+                ),
+            ),
+            self.parse_args(),
+            automaton=None,
+        )
+
+        assert plugins[0].exclude_lines_regex is None
 
 
 class TestFromPluginClassname:
@@ -24,6 +157,24 @@ class TestFromPluginClassname:
 
         assert not plugin
 
+    def test_warns_if_no_such_plugin(self):
+        with mock.patch(
+            'detect_secrets.plugins.common.initialize.sys.stderr',
+            new=StringIO(),
+        ) as fake_stderr:
+            plugin = initialize.from_plugin_classname(
+                'NonExistentDetector',
+            )
+
+        assert not plugin
+        assert uncolor(fake_stderr.getvalue()) == (
+            'Warning: No such NonExistentDetector plugin to initialize.\n'
+            'Chances are you\'ve disabled it with command line options, '
+            'or need to run `pre-commit autoupdate`.\n'
+            'This error occurs when using a baseline file that '
+            'references a plugin which is disabled or not installed.\n'
+        )
+
     def test_fails_on_bad_initialization(self):
         with mock.patch.object(
             HexHighEntropyString,
@@ -71,3 +222,78 @@ class TestFromSecretType:
             'Base64 High Entropy String',
             settings=[],
         )
+
+
+class TestGetPrioritizedParameters:
+
+    def setup_method(self):
+        self.plugins_dict = {
+            'HexHighEntropyString': {
+                'hex_limit': 3,
+            },
+            'KeywordDetector': {
+                'keyword_exclude': None,
+            },
+            'PrivateKeyDetector': {},
+        }
+
+    @pytest.mark.parametrize(
+        'prefer_default, expected',
+        [
+            (
+                True,
+                [
+                    ('HexHighEntropyString', 'hex_limit', 3),
+                ],
+            ),
+            (
+                False,
+                [
+                    ('KeywordDetector', 'keyword_exclude', None),
+                ],
+            ),
+        ],
+    )
+    def test_missing_values_are_not_default(self, prefer_default, expected):
+        assert list(
+            initialize._get_prioritized_parameters(
+                self.plugins_dict,
+                {
+                    'hex_limit': True,
+                },
+                prefer_default=prefer_default,
+            ),
+        ) == expected
+
+    @pytest.mark.parametrize(
+        'prefer_default',
+        (
+            True,
+            False,
+        ),
+    )
+    def test_yields_nothing_when_no_parameters_match(self, prefer_default):
+        assert list(
+            initialize._get_prioritized_parameters(
+                self.plugins_dict,
+                {
+                    'hex_limit': not prefer_default,
+                    'keyword_exclude': not prefer_default,
+                },
+                prefer_default=prefer_default,
+            ),
+        ) == []
+
+    def test_skips_plugins_when_nothing_is_default(self):
+        plugins_dict = mock.Mock()
+
+        assert list(
+            initialize._get_prioritized_parameters(
+                plugins_dict,
+                {
+                    'hex_limit': False,
+                },
+                prefer_default=True,
+            ),
+        ) == []
+        plugins_dict.items.assert_not_called()
@@ -0,0 +1,65 @@
+import threading
+
+import mock
+import pytest
+
+from detect_secrets.plugins.common import util
+
+
+@pytest.mark.parametrize(
+    'plugin_filenames, expected',
+    (
+        (None, None),
+        ((), ()),
+        (['keyword', 'aws'], ('aws', 'keyword')),
+        (('keyword', 'aws', 'keyword'), ('aws', 'keyword')),
+    ),
+)
+def test_normalize_plugin_filenames(plugin_filenames, expected):
+    assert util.normalize_plugin_filenames(plugin_filenames) == expected
+
+
+class TestImportPlugins:
+
+    def setup_method(self):
+        self.plugin_filenames = ('private_key',)
+        util._plugins_cache.pop(self.plugin_filenames, None)
+
+    def teardown_method(self):
+        util._plugins_cache.pop(self.plugin_filenames, None)
+
+    def test_only_imports_once(self):
+        with mock.patch.object(
+            util,
+            '_import_plugins',
+            wraps=util._import_plugins,
+        ) as mock_import_plugins:
+            first = util.import_plugins(self.plugin_filenames)
+            second = util.import_plugins(self.plugin_filenames)
+
+        assert list(first) == ['PrivateKeyDetector']
+        assert first is second
+        mock_import_plugins.assert_called_once_with(self.plugin_filenames)
+
+    def test_concurrent_first_calls_only_import_once(self):
+        results = []
+
+        def import_plugins():
+            results.append(util.import_plugins(self.plugin_filenames))
+
+        with mock.patch.object(
+            util,
+            '_import_plugins',
+            wraps=util._import_plugins,
+        ) as mock_import_plugins:
+            threads = [
+                threading.Thread(target=import_plugins)
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_import_plugins.assert_called_once_with(self.plugin_filenames)
+        assert all(result is results[0] for result in results)